@@ -170,6 +170,22 @@ def disable_pipeline():
         PipelineMeta.disable = False
 
 
+@contextmanager
+def cached_ranges():
+    """
+    Memoize Dataset data ranges for the duration of the context, e.g.
+    while a plot is rendered. The data must not be modified in place
+    within the context.
+    """
+    scope = Dataset._range_cache_scope
+    if scope is None:
+        Dataset._range_cache_scope = object()
+    try:
+        yield
+    finally:
+        Dataset._range_cache_scope = scope
+
+
 class PipelineMeta(ParameterizedMetaclass):
 
     # Public methods that should not be wrapped
@@ -273,6 +289,9 @@ class Dataset(Element):
     # Whether the key dimensions are specified as bins
     _binned = False
 
+    # Token identifying the active cached_ranges context, if any
+    _range_cache_scope = None
+
     _vdim_reductions = {}
     _kdim_reductions = {}
 
@@ -381,6 +400,7 @@ class Dataset(Element):
             obj_dict['_pipeline'] = pipeline.instance(operations=pipeline.operations[:1])
         if '_transforms' in obj_dict:
             obj_dict['_transforms'] = []
+        obj_dict.pop('_range_cache', None)
         return obj_dict
 
     @property
@@ -512,7 +532,7 @@ class Dataset(Element):
         elif all(util.isfinite(v) for v in dim.range) and dimension_range:
             return dim.range
         elif dim in self.dimensions() and data_range and bool(self):
-            lower, upper = self.interface.range(self, dim)
+            lower, upper = self._data_range(dim)
         else:
             lower, upper = (np.NaN, np.NaN)
         if not dimension_range:
@@ -520,6 +540,23 @@ class Dataset(Element):
         return util.dimension_range(lower, upper, dim.range, dim.soft_range)
 
 
+    def _data_range(self, dim):
+        """
+        Computes the range of the data along the supplied dimension,
+        memoizing the result within a cached_ranges context.
+        """
+        scope = Dataset._range_cache_scope
+        if scope is None:
+            return self.interface.range(self, dim)
+        cache = getattr(self, '_range_cache', None)
+        if cache is None or cache[0] is not scope or cache[1] is not self.data:
+            cache = self._range_cache = (scope, self.data, {})
+        key = (dim.name, dim.nodata)
+        if key not in cache[2]:
+            cache[2][key] = self.interface.range(self, dim)
+        return cache[2][key]
+
+
     def add_dimension(self, dimension, dim_pos, dim_val, vdim=False, **kwargs):
         """Adds a dimension and its values to the Dataset
 
@@ -614,15 +651,25 @@ argument to specify a selection specification""")
 
         if selection_specs is not None and not isinstance(selection_specs, (list, tuple)):
             selection_specs = [selection_specs]
+        valid_dims = self.dimensions()+['selection_mask']
         selection = {dim_name: sel for dim_name, sel in selection.items()
-                     if dim_name in self.dimensions()+['selection_mask']}
+                     if dim_name in valid_dims}
         if (selection_specs and not any(self.matches(sp) for sp in selection_specs)
             or (not selection and not selection_expr)):
             return self
 
-        # Handle selection dim expression
+        # Handle selection dim expression, folding any keyword
+        # selections into the mask so the data is filtered once
         if selection_expr is not None:
             mask = selection_expr.apply(self, compute=False, keep_index=True)
+            kwargs = {k: v for k, v in selection.items() if k != 'selection_mask'}
+            if kwargs and not self.interface.gridded:
+                # Some interfaces (e.g. ibis) return a list of predicates
+                predicates = self.interface.select_mask(self, kwargs)
+                if not isinstance(predicates, list):
+                    predicates = [predicates]
+                for predicate in predicates:
+                    mask = mask & predicate
             selection = {'selection_mask': mask}
 
         # Handle selection kwargs
@@ -705,20 +752,24 @@ argument to specify a selection specification""")
             if not len(slices) == len(self):
                 raise IndexError("Boolean index must match length of sliced object")
             return self.clone(self.select(selection_mask=slices))
-        elif (isinstance(slices, ()) and len(slices) == 1) or slices is Ellipsis:
+        elif (isinstance(slices, tuple) and not slices) or slices is Ellipsis:
             return self
         if not isinstance(slices, tuple): slices = (slices,)
         value_select = None
-        if len(slices) == 1 and slices[0] in self.dimensions():
+        dimensions, ndims = self.dimensions(), self.ndims
+        # Only strings and Dimensions can reference a dimension, so
+        # avoid comparing other keys against every dimension
+        if len(slices) == 1 and isinstance(slices[0], (Dimension, str)) and slices[0] in dimensions:
             return self.dimension_values(slices[0])
-        elif len(slices) == self.ndims+1 and slices[self.ndims] in self.dimensions():
-            selection = dict(zip(self.dimensions('key', label=True), slices))
-            value_select = slices[self.ndims]
-        elif len(slices) == self.ndims+1 and isinstance(slices[self.ndims],
-                                                        (Dimension,str)):
-            raise IndexError("%r is not an available value dimension" % slices[self.ndims])
+        elif len(slices) == ndims+1 and isinstance(slices[ndims], (Dimension, str)):
+            if slices[ndims] not in dimensions:
+                raise IndexError("%r is not an available value dimension" % slices[ndims])
+            selection = dict(zip([kd.name for kd in self.kdims], slices))
+            value_select = slices[ndims]
+        elif len(slices) == 1 and dimensions:
+            selection = {dimensions[0].name: slices[0]}
         else:
-            selection = dict(zip(self.dimensions(label=True), slices))
+            selection = dict(zip([d.name for d in dimensions], slices))
         data = self.select(**selection)
         if value_select:
             if data.shape[0] == 1:
@@ -56,6 +56,8 @@ class DictInterface(Interface):
                     data = np.column_stack([np.arange(len(data)), data])
                 else:
                     data = np.atleast_2d(data).T
+            # Column-major layout makes each column a contiguous view
+            data = np.asfortranarray(data)
             data = {k: data[:,i] for i,k in enumerate(dimensions)}
         elif isinstance(data, list) and data == []:
             data = OrderedDict([(d, []) for d in dimensions])
@@ -284,6 +286,37 @@ class DictInterface(Interface):
                             for d in dimensions])
 
 
+    @classmethod
+    def _factorize(cls, columns, length):
+        """
+        Given a list of key columns (or scalars) computes the unique
+        keys, in order of first appearance, along with the integer
+        indices of the rows belonging to each key. Factorizes the
+        columns with NumPy rather than building a key tuple per row.
+        Returns None if any column is not a finite numeric, datetime
+        or string array.
+        """
+        codes = []
+        for col in columns:
+            if isscalar(col):
+                codes.append(np.zeros(length, dtype=int))
+            elif (isinstance(col, np.ndarray) and col.dtype.kind in 'biufMSU'
+                  and util.isfinite(col).all()):
+                codes.append(np.unique(col, return_inverse=True)[1])
+            else:
+                return None
+        if not length:
+            return []
+        elif not codes:
+            return [((), np.arange(length))]
+        _, first, inverse = np.unique(np.column_stack(codes), axis=0,
+                                      return_index=True, return_inverse=True)
+        inverse = inverse.ravel()
+        indices = np.split(np.argsort(inverse, kind='stable'),
+                           np.cumsum(np.bincount(inverse))[:-1])
+        return [(tuple(col if isscalar(col) else col[first[g]] for col in columns),
+                 indices[g]) for g in np.argsort(first)]
+
     @classmethod
     def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
         # Get dimensions information
@@ -300,14 +333,17 @@ class DictInterface(Interface):
         group_kwargs.update(kwargs)
 
         # Find all the keys along supplied dimensions
-        keys = (tuple(dataset.data[d.name] if isscalar(dataset.data[d.name])
-                      else dataset.data[d.name][i] for d in dimensions)
-                for i in range(len(dataset)))
+        columns = [dataset.data[d.name] for d in dimensions]
+        groups = cls._factorize(columns, len(dataset))
+        if groups is None:
+            keys = (tuple(col if isscalar(col) else col[i] for col in columns)
+                    for i in range(len(dataset)))
+            groups = ((unique_key, cls.select_mask(dataset, dict(zip(dimensions, unique_key))))
+                      for unique_key in util.unique_iterator(keys))
 
         # Iterate over the unique entries applying selection masks
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = cls.select_mask(dataset, dict(zip(dimensions, unique_key)))
+        for unique_key, mask in groups:
             group_data = OrderedDict(((d.name, dataset.data[d.name] if isscalar(dataset.data[d.name])
                                        else dataset.data[d.name][mask])
                                       for d in kdims+vdims))
@@ -361,12 +361,14 @@ class Interface(param.Parameterized):
                     if sel.stop is not None:
                         mask &= arr < sel.stop
             elif isinstance(sel, (set, list)):
-                iter_slcs = []
+                # Accumulate matches into a single buffer rather than
+                # keeping a mask per selected value
+                sel_mask = np.zeros(len(arr), dtype=np.bool_)
                 for ik in sel:
                     with warnings.catch_warnings():
                         warnings.filterwarnings('ignore', r'invalid value encountered')
-                        iter_slcs.append(arr == ik)
-                mask &= np.logical_or.reduce(iter_slcs)
+                        sel_mask |= arr == ik
+                mask &= sel_mask
             elif callable(sel):
                 mask &= sel(arr)
             else:
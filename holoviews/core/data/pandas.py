@@ -3,6 +3,9 @@ try:
 except ImportError:
     pass
 
+import warnings
+import weakref
+
 import numpy as np
 import pandas as pd
 
@@ -21,11 +24,14 @@ class PandasInterface(Interface):
 
     datatype = 'dataframe'
 
+    # DataFrames already processed by downcast, keyed by id
+    _downcast_checked = weakref.WeakValueDictionary()
+
     @classmethod
     def dimension_type(cls, dataset, dim):
         name = dataset.get_dimension(dim, strict=True).name
-        idx = list(dataset.data.columns).index(name)
-        return dataset.data.dtypes[idx].type
+        idx = dataset.data.columns.get_loc(name)
+        return dataset.data.dtypes.iloc[idx].type
 
     @classmethod
     def init(cls, eltype, data, kdims, vdims):
@@ -79,13 +85,15 @@ class PandasInterface(Interface):
                     data = data.copy()
                     data.insert(0, kdim, np.arange(len(data)))
 
-            for d in kdims+vdims:
-                d = dimension_name(d)
-                if len([c for c in data.columns if c == d]) > 1:
-                    raise DataError('Dimensions may not reference duplicated DataFrame '
-                                    'columns (found duplicate %r columns). If you want to plot '
-                                    'a column against itself simply declare two dimensions '
-                                    'with the same name. '% d, cls)
+            if not data.columns.is_unique:
+                duplicated = data.columns[data.columns.duplicated()]
+                for d in kdims+vdims:
+                    d = dimension_name(d)
+                    if d in duplicated:
+                        raise DataError('Dimensions may not reference duplicated DataFrame '
+                                        'columns (found duplicate %r columns). If you want to plot '
+                                        'a column against itself simply declare two dimensions '
+                                        'with the same name. '% d, cls)
         else:
             # Check if data is of non-numeric type
             # Then use defined data type
@@ -107,9 +115,10 @@ class PandasInterface(Interface):
                     raise ValueError("Dictionary data not understood, should contain a column "
                                     "per dimension or a mapping between key and value dimension "
                                     "values.")
-                column_data = zip(*((util.wrap_tuple(k)+util.wrap_tuple(v))
-                                    for k, v in column_data))
-                data = cyODict(((c, col) for c, col in zip(columns, column_data)))
+                # Construct the frame directly from the row records
+                # instead of transposing them into column tuples
+                records = [util.wrap_tuple(k)+util.wrap_tuple(v) for k, v in column_data]
+                data = pd.DataFrame.from_records(records, columns=columns)
             elif isinstance(data, np.ndarray):
                 if data.ndim == 1:
                     if eltype._auto_indexable_1d and len(kdims)+len(vdims)>1:
@@ -136,9 +145,51 @@ class PandasInterface(Interface):
                 raise ValueError('PandasInterface could not find specified dimensions in the data.')
             else:
                 data = pd.DataFrame(data, columns=columns)
+        if util.config.downcast_numeric:
+            data = cls.downcast(data)
         return data, {'kdims':kdims, 'vdims':vdims}, {}
 
 
+    @classmethod
+    def downcast(cls, data):
+        """
+        Downcasts 64-bit integer and float columns to the smallest
+        dtype able to represent their values, see config.downcast_numeric.
+        """
+        if not isinstance(data, pd.DataFrame) or not data.columns.is_unique:
+            return data
+        elif cls._downcast_checked.get(id(data)) is data:
+            # Data re-wrapped on clone has already been downcast
+            return data
+        downcast = {}
+        for col, dtype in data.dtypes.items():
+            if dtype == np.int64:
+                kind, info = 'integer', np.iinfo(np.int32)
+            elif dtype == np.float64:
+                kind, info = 'float', np.finfo(np.float32)
+            else:
+                continue
+            # Cheaply skip columns outside the range of the smaller
+            # dtype, e.g. int64 timestamps, since init runs on every
+            # clone and select
+            column = data[col].values
+            if len(column):
+                with warnings.catch_warnings():
+                    warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+                    cmin, cmax = np.nanmin(column), np.nanmax(column)
+                if cmin < info.min or cmax > info.max:
+                    continue
+            values = pd.to_numeric(data[col], downcast=kind)
+            if values.dtype != dtype:
+                downcast[col] = values
+        if downcast:
+            data = data.copy(deep=False)
+            for col, values in downcast.items():
+                data[col] = values
+        cls._downcast_checked[id(data)] = data
+        return data
+
+
     @classmethod
     def isscalar(cls, dataset, dim):
         name = dataset.get_dimension(dim, strict=True).name
@@ -149,7 +200,7 @@ class PandasInterface(Interface):
     def validate(cls, dataset, vdims=True):
         dim_types = 'all' if vdims else 'key'
         dimensions = dataset.dimensions(dim_types, label='name')
-        cols = list(dataset.data.columns)
+        cols = dataset.data.columns
         not_found = [d for d in dimensions if d not in cols]
         if not_found:
             raise DataError("Supplied data does not contain specified "
@@ -177,7 +228,18 @@ class PandasInterface(Interface):
         else:
             if dimension.nodata is not None:
                 column = cls.replace_value(column, dimension.nodata)
-            cmin, cmax = finite_range(column, column.min(), column.max())
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biuf':
+                # Reduce the underlying NumPy array directly, avoiding
+                # the overhead of the pandas reductions
+                values = column.values
+                if not len(values):
+                    return np.NaN, np.NaN
+                with warnings.catch_warnings():
+                    warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+                    cmin, cmax = np.nanmin(values), np.nanmax(values)
+            else:
+                cmin, cmax = column.min(), column.max()
+            cmin, cmax = finite_range(column, cmin, cmax)
             if column.dtype.kind == 'M' and getattr(column.dtype, 'tz', None):
                 return (cmin.to_pydatetime().replace(tzinfo=None),
                         cmax.to_pydatetime().replace(tzinfo=None))
@@ -218,8 +280,9 @@ class PandasInterface(Interface):
         group_kwargs['dataset'] = dataset.dataset
 
         group_by = [d.name for d in index_dims]
+        groupby_kwargs = {'observed': True} if util.pandas_version >= '0.23.0' else {}
         data = [(k, group_type(v, **group_kwargs)) for k, v in
-                dataset.data.groupby(group_by, sort=False)]
+                dataset.data.groupby(group_by, sort=False, **groupby_kwargs)]
         if issubclass(container_type, NdMapping):
             with item_check(False), sorted_context(False):
                 return container_type(data, kdims=index_dims)
@@ -240,8 +303,16 @@ class PandasInterface(Interface):
         else:
             fn = function
         if len(dimensions):
-            grouped = reindexed.groupby(cols, sort=False)
-            df = grouped.aggregate(fn, **kwargs).reset_index()
+            groupby_kwargs = {'observed': True} if util.pandas_version >= '0.23.0' else {}
+            grouped = reindexed.groupby(cols, sort=False, **groupby_kwargs)
+            numeric = all(reindexed[vd].dtype.kind in 'biuf' for vd in vdims)
+            if function in [np.std, np.var] and numeric and not kwargs:
+                # Use the cythonized groupby reduction rather than
+                # calling the wrapped function on each group
+                df = getattr(grouped, function.__name__)(ddof=0)
+            else:
+                df = grouped.aggregate(fn, **kwargs)
+            df = df.reset_index()
         else:
             agg = reindexed.apply(fn, **kwargs)
             data = dict(((col, [v]) for col, v in zip(agg.index, agg.values)))
@@ -337,27 +408,26 @@ class PandasInterface(Interface):
     @classmethod
     def sample(cls, dataset, samples=[]):
         data = dataset.data
-        mask = None
+        mask = np.zeros(len(data), dtype=np.bool_)
+        columns = {}
         for sample in samples:
-            sample_mask = None
+            sample_mask = np.ones(len(data), dtype=np.bool_)
             if np.isscalar(sample): sample = [sample]
             for i, v in enumerate(sample):
-                submask = data.iloc[:, i]==v
-                if sample_mask is None:
-                    sample_mask = submask
-                else:
-                    sample_mask &= submask
-            if mask is None:
-                mask = sample_mask
-            else:
-                mask |= sample_mask
+                if i not in columns:
+                    column = data[dataset.get_dimension(i).name]
+                    # Timezone aware columns are compared as a Series
+                    columns[i] = column if getattr(column.dtype, 'tz', None) else column.values
+                sample_mask &= np.asarray(columns[i]==v)
+            mask |= sample_mask
         return data[mask]
 
 
     @classmethod
     def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
-        data = dataset.data.copy()
+        data = dataset.data
         if dimension.name not in data:
+            data = data.copy()
             data.insert(dim_pos, dimension.name, values)
         return data
 
@@ -389,7 +459,6 @@ class PandasInterface(Interface):
     def iloc(cls, dataset, index):
         rows, cols = index
         scalar = False
-        columns = list(dataset.data.columns)
         if isinstance(cols, slice):
             cols = [d.name for d in dataset.dimensions()][cols]
         elif np.isscalar(cols):
@@ -397,7 +466,8 @@ class PandasInterface(Interface):
             cols = [dataset.get_dimension(cols).name]
         else:
             cols = [dataset.get_dimension(d).name for d in index[1]]
-        cols = [columns.index(c) for c in cols]
+        get_loc = dataset.data.columns.get_loc
+        cols = [get_loc(c) for c in cols]
         if np.isscalar(rows):
             rows = [rows]
 
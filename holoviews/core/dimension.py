@@ -703,6 +703,7 @@ class LabelledData(param.Parameterized):
     def __getstate__(self):
         "Ensures pickles save options applied to this objects."
         obj_dict = self.__dict__.copy()
+        obj_dict.pop('_dim_name_map', None)
         try:
             if Store.save_option_state and (obj_dict.get('_id', None) is not None):
                 custom_key = '_custom_option_%d' % obj_dict['_id']
@@ -971,16 +972,32 @@ class Dimensioned(LabelledData):
                 return None
         else:
             dimension = dimension_name(dimension)
-            name_map = {dim.spec: dim for dim in all_dims}
-            name_map.update({dim.name: dim for dim in all_dims})
-            name_map.update({dim.label: dim for dim in all_dims})
-            name_map.update({util.dimension_sanitizer(dim.name): dim for dim in all_dims})
+            name_map = self._dimension_name_map(all_dims)
             if strict and dimension not in name_map:
                 raise KeyError("Dimension %r not found." % dimension)
             else:
                 return name_map.get(dimension, default)
 
 
+    def _dimension_name_map(self, all_dims):
+        """
+        Returns a lookup from the spec, name, label and sanitized name
+        of each Dimension to the Dimension itself. The lookup is cached
+        until the dimensions of the object change.
+        """
+        cached = self.__dict__.get('_dim_name_map')
+        if cached is not None:
+            dims, name_map = cached
+            if len(dims) == len(all_dims) and all(d1 is d2 for d1, d2 in zip(dims, all_dims)):
+                return name_map
+        name_map = {dim.spec: dim for dim in all_dims}
+        name_map.update({dim.name: dim for dim in all_dims})
+        name_map.update({dim.label: dim for dim in all_dims})
+        name_map.update({util.dimension_sanitizer(dim.name): dim for dim in all_dims})
+        self._dim_name_map = (all_dims, name_map)
+        return name_map
+
+
     def get_dimension_index(self, dimension):
         """Get the index of the requested dimension.
 
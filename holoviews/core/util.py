@@ -106,6 +106,15 @@ class Config(param.ParameterizedFunction):
       maximal allowable sampling difference between sample
       locations.""")
 
+    downcast_numeric = param.Boolean(default=False, doc="""
+       Whether to downcast 64-bit integer and float columns of pandas
+       DataFrames to the smallest dtype able to represent their values
+       when constructing a Dataset. Reduces memory use and speeds up
+       selections and groupby operations on large frames, but floats
+       may be stored in single precision (within numpy.allclose
+       tolerance of the original values) and arithmetic on small
+       integer types may overflow.""")
+
     no_padding = param.Boolean(default=False, doc="""
        Disable default padding (introduced in 1.13.0).""")
 
@@ -16,6 +16,7 @@ from ..core.util import (
 try:
     import pandas as pd
     from ..core.data import PandasInterface
+    from ..core.util import pandas_version
 except:
     pd = None
 
@@ -140,12 +141,19 @@ class categorical_aggregate2d(Operation):
             return xcoords, np.sort(ycoords)
 
         # Determine global orderings of y-values using topological sort
-        grouped = obj.groupby(xdim, container_type=OrderedDict,
-                              group_type=Dataset).values()
+        if pd and isinstance(obj.data, pd.DataFrame):
+            # Compute unique y-values per x-group in a single pandas
+            # groupby instead of constructing an element per group
+            xname, yname = (obj.get_dimension(d).name for d in (xdim, ydim))
+            kwargs = {'observed': True} if pandas_version >= '0.23.0' else {}
+            grouped = obj.data.groupby(xname, sort=False, **kwargs)[yname].unique().values
+        else:
+            grouped = obj.groupby(xdim, container_type=OrderedDict,
+                                  group_type=Dataset).values()
+            grouped = [group.dimension_values(ydim, False) for group in grouped]
         orderings = OrderedDict()
         sort = True
-        for group in grouped:
-            vals = group.dimension_values(ydim, False)
+        for vals in grouped:
             if len(vals) == 1:
                 orderings[vals[0]] = [vals[0]]
             else:
@@ -191,7 +199,8 @@ class categorical_aggregate2d(Operation):
             agg = reindexed
         elif pd:
             df = PandasInterface.as_dframe(reindexed)
-            df = df.groupby([xdim, ydim], sort=False).first().reset_index()
+            kwargs = {'observed': True} if pandas_version >= '0.23.0' else {}
+            df = df.groupby([xdim, ydim], sort=False, **kwargs).first().reset_index()
             agg = reindexed.clone(df)
         else:
             agg = reindexed.aggregate([xdim, ydim], reduce_fn)
@@ -204,7 +213,8 @@ class categorical_aggregate2d(Operation):
 
     def _aggregate_dataset_pandas(self, obj):
         index_cols = [d.name for d in obj.kdims]
-        df = obj.data.set_index(index_cols).groupby(index_cols, sort=False).first()
+        kwargs = {'observed': True} if pandas_version >= '0.23.0' else {}
+        df = obj.data.groupby(index_cols, sort=False, **kwargs).first()
         label = 'unique' if len(df) == len(obj) else 'non-unique'
         levels = self._get_coords(obj)
         index = pd.MultiIndex.from_product(levels, names=df.index.names)
@@ -277,7 +287,12 @@ def connect_edges_pd(graph):
     edges = graph.dframe()
     edges.index.name = 'graph_edge_index'
     edges = edges.reset_index()
-    nodes = graph.nodes.dframe()
+    # Read plain pandas nodes without copying, other pandas-like
+    # interfaces (e.g. dask and cuDF) must be computed to pandas
+    if graph.nodes.interface is PandasInterface:
+        nodes = graph.nodes.data
+    else:
+        nodes = graph.nodes.dframe()
     src, tgt = graph.kdims
     x, y, idx = graph.nodes.kdims[:3]
 
@@ -288,12 +303,8 @@ def connect_edges_pd(graph):
     df = df.rename(columns={x.name: 'dst_x', y.name: 'dst_y'})
     df = df.sort_values('graph_edge_index').drop(['graph_edge_index'], axis=1)
 
-    edge_segments = []
-    for i, edge in df.iterrows():
-        start = edge['src_x'], edge['src_y']
-        end = edge['dst_x'], edge['dst_y']
-        edge_segments.append(np.array([start, end]))
-    return edge_segments
+    edge_segments = df[['src_x', 'src_y', 'dst_x', 'dst_y']].values
+    return list(edge_segments.reshape(len(df), 2, 2))
 
 
 def connect_tri_edges_pd(trimesh):
@@ -303,11 +314,15 @@ def connect_tri_edges_pd(trimesh):
     operation depends on pandas and is a lot faster than the pure
     NumPy equivalent.
     """
-    edges = trimesh.dframe().copy()
+    edges = trimesh.dframe()
     edges.index.name = 'trimesh_edge_index'
     edges = edges.reset_index()
-    nodes = trimesh.nodes.dframe().copy()
-    nodes.index.name = 'node_index'
+    # Read plain pandas nodes without copying, other pandas-like
+    # interfaces (e.g. dask and cuDF) must be computed to pandas
+    if trimesh.nodes.interface is PandasInterface:
+        nodes = trimesh.nodes.data
+    else:
+        nodes = trimesh.nodes.dframe()
     v1, v2, v3 = trimesh.kdims
     x, y, idx = trimesh.nodes.kdims[:3]
 
@@ -211,6 +211,8 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
 
         factors = []
         vdim = element.vdims[0].name
+        hover = 'hover' in self.handles
+        kd_names = [dimension_sanitizer(kd.name) for kd in element.kdims]
         for key, g in groups.items():
             # Compute group label
             if element.kdims:
@@ -219,7 +221,6 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
                     label = label[0]
             else:
                 label = key
-            hover = 'hover' in self.handles
 
             # Add color factor
             if cidx is not None and cidx<element.ndims:
@@ -256,11 +257,10 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
                 out_data['index'] += [label]*len(outliers)
                 out_data[vdim] += list(outliers)
                 if hover:
-                    for kd, k in zip(element.kdims, wrap_tuple(key)):
-                        out_data[dimension_sanitizer(kd.name)] += [k]*len(outliers)
+                    for kd_name, k in zip(kd_names, wrap_tuple(key)):
+                        out_data[kd_name] += [k]*len(outliers)
             if hover:
-                for kd, k in zip(element.kdims, wrap_tuple(key)):
-                    kd_name = dimension_sanitizer(kd.name)
+                for kd_name, k in zip(kd_names, wrap_tuple(key)):
                     if kd_name in r1_data:
                         r1_data[kd_name].append(k)
                     else:
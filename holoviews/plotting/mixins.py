@@ -1,6 +1,7 @@
 import numpy as np
+import pandas as pd
 
-from ..core import util, Dataset, Dimension
+from ..core import util, Dimension
 from ..element import Bars
 from ..element.util import categorical_aggregate2d
 from .util import get_axis_padding
@@ -154,10 +155,14 @@ class BarsMixin(object):
         # Compute stack heights
         xdim = element.kdims[0]
         if self.stacked:
-            ds = Dataset(element)
-            pos_range = ds.select(**{vdim: (0, None)}).aggregate(xdim, function=np.sum).range(vdim)
-            neg_range = ds.select(**{vdim: (None, 0)}).aggregate(xdim, function=np.sum).range(vdim)
-            y0, y1 = util.max_range([pos_range, neg_range])
+            # Sum positive and negative values per category in a
+            # single groupby over the category and the sign
+            xs = element.dimension_values(xdim)
+            ys = element.dimension_values(vdim)
+            valid = ~pd.isnull(ys)
+            xs, ys = xs[valid], ys[valid]
+            stacks = pd.Series(ys).groupby([xs, ys >= 0], sort=False).sum()
+            y0, y1 = (stacks.min(), stacks.max()) if len(stacks) else (np.nan, np.nan)
         else:
             y0, y1 = ranges[vdim]['combined']
 
@@ -13,6 +13,7 @@ from matplotlib.font_manager import font_scalings
 from ...core import (OrderedDict, HoloMap, AdjointLayout, NdLayout,
                      GridSpace, Element, CompositeOverlay, Empty,
                      Collator, GridMatrix, Layout)
+from ...core.data import cached_ranges
 from ...core.options import Store, SkipRendering
 from ...core.util import int_to_roman, int_to_alpha, wrap_tuple_streams
 from ..plot import (DimensionedPlot, GenericLayoutPlot, GenericCompositePlot,
@@ -245,9 +246,10 @@ class MPLPlot(DimensionedPlot):
 
 
     def update(self, key):
-        if len(self) == 1 and ((key == 0) or (key == self.keys[0])) and not self.drawn:
-            return self.initialize_plot()
-        return self.__getitem__(key)
+        with cached_ranges():
+            if len(self) == 1 and ((key == 0) or (key == self.keys[0])) and not self.drawn:
+                return self.initialize_plot()
+            return self.__getitem__(key)
 
 
 
@@ -23,7 +23,7 @@ from pyviz_comms import JupyterComm
 from ..selection import NoOpSelectionDisplay
 from ..core import OrderedDict
 from ..core import util, traversal
-from ..core.data import Dataset, disable_pipeline
+from ..core.data import Dataset, cached_ranges, disable_pipeline
 from ..core.element import Element, Element3D
 from ..core.overlay import Overlay, CompositeOverlay
 from ..core.layout import Empty, NdLayout, Layout
@@ -952,9 +952,10 @@ class DimensionedPlot(Plot):
         return custom_projs[0] if custom_projs else None
 
     def update(self, key):
-        if len(self) == 1 and ((key == 0) or (key == self.keys[0])) and not self.drawn:
-            return self.initialize_plot()
-        item = self.__getitem__(key)
+        with cached_ranges():
+            if len(self) == 1 and ((key == 0) or (key == self.keys[0])) and not self.drawn:
+                return self.initialize_plot()
+            item = self.__getitem__(key)
         self.traverse(lambda x: setattr(x, '_updated', True))
         return item
 
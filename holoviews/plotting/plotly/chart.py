@@ -1,5 +1,6 @@
 import param
 import numpy as np
+import pandas as pd
 
 from ...operation import interpolate_curve
 from ...element import Tiles
@@ -208,6 +209,18 @@ class BarPlot(BarsMixin, ElementPlot):
     def trace_kwargs(cls, is_geo=False, **kwargs):
         return {'type': 'bar'}
 
+    @classmethod
+    def _get_values(cls, element, xvals):
+        """
+        Looks up the first value corresponding to each of the supplied
+        x-values in a single reindexing operation, defaulting to zero
+        for x-values not present in the element.
+        """
+        values = pd.Series(element.dimension_values(1),
+                           index=element.dimension_values(0))
+        values = values[~values.index.duplicated()]
+        return list(values.reindex(xvals, fill_value=0).values)
+
     def _get_axis_dims(self, element):
         if element.ndims > 1 and not self.stacked:
             xdims = element.kdims
@@ -250,10 +263,7 @@ class BarPlot(BarsMixin, ElementPlot):
 
         bars = []
         if element.ndims == 1:
-            values = []
-            for v in xvals:
-                sel = element[[v]]
-                values.append(sel.iloc[0, 1] if len(sel) else 0)
+            values = self._get_values(element, xvals)
             bars.append({
                 'orientation': orientation, 'showlegend': False,
                 x: [xdim.pprint_value(v) for v in xvals],
@@ -265,10 +275,7 @@ class BarPlot(BarsMixin, ElementPlot):
             sorted_groups = sorted(els.items(), key=lambda x: order.index(x[0])
                                    if x[0] in order else -1)
             for k, el in sorted_groups[::-1]:
-                values = []
-                for v in xvals:
-                    sel = el[[v]]
-                    values.append(sel.iloc[0, 1] if len(sel) else 0)
+                values = self._get_values(el, xvals)
                 bars.append({
                     'orientation': orientation, 'name': group_dim.pprint_value(k),
                     x: [xdim.pprint_value(v) for v in xvals],
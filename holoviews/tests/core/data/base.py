@@ -4,6 +4,7 @@ Tests for the Dataset Element types.
 
 import datetime
 from unittest import SkipTest, skipIf
+from unittest.mock import patch
 
 import numpy as np
 
@@ -158,6 +159,19 @@ class HomogeneousColumnTests(object):
 
     # Operations
 
+    def test_dataset_select_expr_and_kwargs_combined(self):
+        ds = Dataset((np.arange(10.), np.arange(10.) % 3, np.arange(10.)*10),
+                     kdims=['x', 'y'], vdims=['z'])
+        selected = ds.select(dim('y') == 1, x=(0, 5))
+        self.assertEqual(selected.dimension_values('x'), np.array([1, 4]))
+
+    def test_dataset_select_expr_and_scalar_kwarg_disjoint(self):
+        ds = Dataset((np.arange(10.), np.arange(10.) % 3, np.arange(10.)*10),
+                     kdims=['x', 'y'], vdims=['z'])
+        selected = ds.select(dim('x') == 4, x=3)
+        self.assertIsInstance(selected, Dataset)
+        self.assertEqual(len(selected), 0)
+
     def test_dataset_sort_hm(self):
         ds = Dataset(([2, 2, 1], [2,1,2], [0.1, 0.2, 0.3]),
                      kdims=['x', 'y'], vdims=['z']).sort()
@@ -296,6 +310,21 @@ class HomogeneousColumnTests(object):
     def test_dataset_index_column_ht(self):
         self.compare_arrays(self.dataset_hm['y'], self.y_ints)
 
+    def test_dataset_index_empty_tuple(self):
+        with patch.object(Dataset, 'select', side_effect=AssertionError):
+            self.assertIs(self.dataset_hm[()], self.dataset_hm)
+
+    def test_dataset_index_scalar_not_compared_to_dimensions(self):
+        key = 5
+        with patch.object(Dimension, '__eq__', autospec=True,
+                          side_effect=Dimension.__eq__) as dim_eq:
+            self.assertEqual(self.dataset_hm[key], self.y_ints[5])
+        self.assertFalse(any(c.args[1] is key for c in dim_eq.call_args_list))
+
+    def test_dataset_index_invalid_value_dimension(self):
+        with self.assertRaises(IndexError):
+            self.dataset_hm[5, 'not_a_dim']
+
     # Tabular indexing
 
     def test_dataset_iloc_slice_rows(self):
@@ -55,3 +55,30 @@ class DictDatasetTest(HeterogeneousColumnTests, ScalarColumnTests, InterfaceTest
                      kdims=['x', 'y'])
         ds2 = Dataset({'x': [0, 1], 'y': [1, 2]}, kdims=['x', 'y'])
         self.assertEqual(ds, ds2)
+
+    def test_dataset_groupby_numeric_keys_first_appearance_order(self):
+        ds = Dataset({'x': [3, 1, 3, 2, 1], 'y': [0.5, 0.5, 1, 0.5, 0.5],
+                      'z': [0, 1, 2, 3, 4]}, kdims=['x', 'y'], vdims=['z'])
+        grouped = ds.groupby(['x', 'y'])
+        self.assertEqual(grouped.keys(), [(3, 0.5), (1, 0.5), (3, 1), (2, 0.5)])
+        self.assertEqual(grouped[1, 0.5], Dataset({'z': [1, 4]}, vdims=['z']))
+
+    def test_dataset_groupby_mixed_scalar_and_object_keys(self):
+        ds = Dataset({'x': 'A', 'y': np.array(['b', None, 'b'], dtype=object),
+                      'z': [0, 1, 2]}, kdims=['x', 'y'], vdims=['z'])
+        grouped = ds.groupby(['x', 'y'])
+        self.assertEqual(grouped.keys(), [('A', 'b'), ('A', None)])
+        self.assertEqual(grouped['A', 'b'], Dataset({'z': [0, 2]}, vdims=['z']))
+
+    def test_dataset_array_columns_contiguous(self):
+        arr = np.arange(12).reshape(6, 2)
+        ds = Dataset(arr, kdims=['x'], vdims=['y'])
+        self.assertTrue(ds.data['x'].flags.c_contiguous)
+        self.assertTrue(ds.data['y'].flags.c_contiguous)
+        self.assertEqual(ds.dimension_values('y'), arr[:, 1])
+
+    def test_dataset_range_reflects_inplace_edit(self):
+        ds = Dataset({'x': [0, 1, 2], 'y': [1., 2., 3.]}, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('y'), (1, 3))
+        ds.data['y'][:] = [10., 20., 30.]
+        self.assertEqual(ds.range('y'), (10, 30))
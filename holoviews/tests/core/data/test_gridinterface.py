@@ -69,6 +69,12 @@ class BaseGridInterfaceTests(GriddedInterfaceTests, HomogeneousColumnTests, Inte
         self.assertEqual(ds.interface.coords(ds, 'x'), xs)
         self.assertEqual(ds.interface.coords(ds, 'y'), ys)
 
+    def test_dataset_select_expr_and_kwargs_combined(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_select_expr_and_scalar_kwarg_disjoint(self):
+        raise SkipTest("Not supported")
+
     def test_dataset_sort_hm(self):
         raise SkipTest("Not supported")
 
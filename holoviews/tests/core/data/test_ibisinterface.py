@@ -14,6 +14,7 @@ import pandas as pd
 
 from holoviews.core.data import Dataset
 from holoviews.core.spaces import HoloMap
+from holoviews.util.transform import dim
 from holoviews.core.data.ibis import IbisInterface
 
 from .base import HeterogeneousColumnTests, ScalarColumnTests, InterfaceTests
@@ -103,6 +104,15 @@ class IbisDatasetTest(HeterogeneousColumnTests, ScalarColumnTests, InterfaceTest
     def test_dataset_array_init_hm(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_select_expr_and_kwargs_combined(self):
+        selected = self.dataset_hm.select(dim('y') > 4, x=(0, 5))
+        self.assertEqual(selected.dimension_values('x'), np.array([3, 4]))
+
+    def test_dataset_select_expr_and_scalar_kwarg_disjoint(self):
+        selected = self.dataset_hm.select(dim('x') == 4, x=3)
+        self.assertIsInstance(selected, Dataset)
+        self.assertEqual(len(selected), 0)
+
     def test_dataset_dict_dim_not_found_raises_on_scalar(self):
         raise SkipTest("Not supported")
 
@@ -8,9 +8,10 @@ except:
     raise SkipTest("Could not import pandas, skipping PandasInterface tests.")
 
 from holoviews.core.dimension import Dimension
-from holoviews.core.data import Dataset
+from holoviews.core.data import Dataset, cached_ranges
 from holoviews.core.data.interface import DataError
 from holoviews.core.spaces import HoloMap
+from holoviews.core.util import config
 from holoviews.element import Scatter, Points, Distribution
 
 
@@ -138,11 +139,36 @@ class BasePandasInterfaceTests(HeterogeneousColumnTests, InterfaceTests):
         group = Dataset({'z': [5, 11, 17]}, vdims=['z'])
         self.assertEqual(grouped.last, group)
 
+    def test_dataset_sample_column_order(self):
+        df = pd.DataFrame({'y': [3, 4, 5], 'x': [0, 1, 2]}, columns=['y', 'x'])
+        ds = Dataset(df, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.sample([1, 2]).dimension_values('y'), np.array([4, 5]))
+
+    def test_dataset_sample_tz_aware(self):
+        dates = pd.date_range('2020-01-01', periods=3, tz='UTC')
+        ds = Dataset(pd.DataFrame({'x': dates, 'y': [3, 4, 5]}), kdims=['x'], vdims=['y'])
+        sampled = ds.interface.sample(ds, [(pd.Timestamp('2020-01-02', tz='UTC'),)])
+        self.assertEqual(sampled['y'].values, np.array([4]))
+
+    def test_dataset_range_with_nans(self):
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [np.NaN, 2.5, 0.5], 'z': [np.NaN]*3})
+        ds = Dataset(df, kdims=['x'], vdims=['y', 'z'])
+        self.assertEqual(ds.range('y'), (0.5, 2.5))
+        zmin, zmax = ds.range('z')
+        self.assertTrue(np.isnan(zmin))
+        self.assertTrue(np.isnan(zmax))
+
     def test_dataset_simple_dict_sorted(self):
         dataset = Dataset({2: 2, 1: 1, 3: 3}, kdims=['x'], vdims=['y'])
         self.assertEqual(dataset, Dataset([(i, i) for i in range(1, 4)],
                                           kdims=['x'], vdims=['y']))
 
+    def test_dataset_tuple_key_dict_dtypes(self):
+        dataset = Dataset({('A', 1): 1.5, ('B', 2): 2.5}, kdims=['x', 'y'], vdims=['z'])
+        self.assertEqual(dataset.dimension_values('x'), np.array(['A', 'B']))
+        self.assertEqual(dataset.interface.dtype(dataset, 'y'), np.dtype('int64'))
+        self.assertEqual(dataset.dimension_values('z'), np.array([1.5, 2.5]))
+
     def test_dataset_conversion_with_index(self):
         df = pd.DataFrame({'y': [1, 2, 3]}, index=[0, 1, 2])
         scatter = Dataset(df).to(Scatter, 'index', 'y')
@@ -177,3 +203,60 @@ class PandasInterfaceTests(BasePandasInterfaceTests):
     data_type = pd.DataFrame
 
     __test__ = True
+
+    def test_dataset_groupby_categorical_skips_unobserved(self):
+        df = pd.DataFrame({'x': pd.Categorical(['a', 'b', 'a'], categories=['a', 'b', 'c']),
+                           'y': [1, 2, 3]})
+        grouped = Dataset(df, kdims=['x'], vdims=['y']).groupby('x')
+        self.assertEqual(grouped.keys(), ['a', 'b'])
+
+    def test_dataset_aggregate_categorical_skips_unobserved(self):
+        df = pd.DataFrame({'x': pd.Categorical(['a', 'b', 'a'], categories=['a', 'b', 'c']),
+                           'y': pd.Categorical(['p', 'q', 'q']), 'z': [1., 2., 3.]})
+        agg = Dataset(df, kdims=['x', 'y'], vdims=['z']).aggregate(['x', 'y'], np.mean)
+        self.assertEqual(agg.dimension_values('z'), np.array([1., 2., 3.]))
+
+    def test_dataset_downcast_numeric_config(self):
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.linspace(0, 1, 10)})
+        config.downcast_numeric = True
+        try:
+            ds = Dataset(df, kdims=['x'], vdims=['y'])
+        finally:
+            config.downcast_numeric = False
+        self.assertEqual(ds.data.dtypes['x'], np.int8)
+        self.assertEqual(ds.data.dtypes['y'], np.float32)
+        self.assertEqual(df.dtypes['x'], np.int64)
+
+    def test_dataset_downcast_numeric_out_of_range(self):
+        df = pd.DataFrame({'x': np.arange(10) * 10**12, 'y': np.linspace(0, 1, 10)})
+        config.downcast_numeric = True
+        try:
+            ds = Dataset(df, kdims=['x'], vdims=['y'])
+            cloned = ds.clone()
+        finally:
+            config.downcast_numeric = False
+        self.assertEqual(ds.data.dtypes['x'], np.int64)
+        self.assertEqual(ds.data.dtypes['y'], np.float32)
+        self.assertIs(cloned.data, ds.data)
+
+    def test_dataset_range_recomputed_on_data_replacement(self):
+        ds = Dataset(pd.DataFrame({'x': [0, 1, 2], 'y': [1, 2, 3]}), kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('y'), (1, 3))
+        ds.data = pd.DataFrame({'x': [0, 1, 2], 'y': [4, 5, 6]})
+        self.assertEqual(ds.range('y'), (4, 6))
+
+    def test_dataset_range_reflects_inplace_edit(self):
+        df = pd.DataFrame({'x': [0, 1, 2], 'y': [1., 2., 3.]})
+        ds = Dataset(df, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('y'), (1, 3))
+        df['y'] *= 10
+        self.assertEqual(ds.range('y'), (10, 30))
+
+    def test_dataset_range_memoized_within_cached_ranges(self):
+        df = pd.DataFrame({'x': [0, 1, 2], 'y': [1., 2., 3.]})
+        ds = Dataset(df, kdims=['x'], vdims=['y'])
+        with cached_ranges():
+            self.assertEqual(ds.range('y'), (1, 3))
+            df['y'] *= 10
+            self.assertEqual(ds.range('y'), (1, 3))
+        self.assertEqual(ds.range('y'), (10, 30))
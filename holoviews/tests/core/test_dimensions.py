@@ -291,3 +291,10 @@ class DimensionedTest(ComparisonTestCase):
         dimensioned = Dimensioned('Arbitrary Data', kdims=['x'])
         redimensioned = dimensioned.redim.cyclic(x=True)
         self.assertEqual(redimensioned.kdims[0].cyclic, True)
+
+    def test_dimensioned_get_dimension_after_kdims_change(self):
+        dimensioned = Dimensioned('Arbitrary Data', kdims=['x'])
+        self.assertEqual(dimensioned.get_dimension('x'), Dimension('x'))
+        dimensioned.kdims[0] = Dimension('y')
+        self.assertEqual(dimensioned.get_dimension('x'), None)
+        self.assertEqual(dimensioned.get_dimension('y'), Dimension('y'))
@@ -105,6 +105,15 @@ class ElementConstructorTest(ComparisonTestCase):
                           kdims=['x', 'y'], vdims=['z'], label='unique')
         self.assertEqual(hmap.gridded, dataset)
 
+    def test_heatmap_construct_partial_sorted_labelled_dims(self):
+        data = [(chr(65+i),chr(97+j), i*j) for i in range(3) for j in [2, 0, 1] if i!=j]
+        kdims, vdims = [('x', 'X'), ('y', 'Y')], [('z', 'Z')]
+        hmap = HeatMap(data, kdims, vdims)
+        dataset = Dataset({'x': ['A', 'B', 'C'], 'y': ['c', 'b', 'a'],
+                           'z': [[0, 2, np.NaN], [np.NaN, 0, 0], [0, np.NaN, 2]]},
+                          kdims=kdims, vdims=vdims, label='unique')
+        self.assertEqual(hmap.gridded, dataset)
+
 
 
 class ElementSignatureTest(ComparisonTestCase):
@@ -78,6 +78,16 @@ class GraphTests(ComparisonTestCase):
             paths.append(np.array([start[:2], end[:2]]))
         self.assertEqual(segments, paths)
 
+    def test_graph_edge_segments_pd_dask_nodes(self):
+        try:
+            import dask.dataframe # noqa
+        except ImportError:
+            raise SkipTest('Test requires dask to be installed')
+        nodes = Nodes(self.nodes, datatype=['dask'])
+        graph = Graph(((self.source, self.target), nodes))
+        segments = connect_edges_pd(graph)
+        self.assertEqual(segments, connect_edges(graph))
+
     def test_constructor_with_nodes_and_paths(self):
         paths = Graph(((self.source, self.target), self.nodes)).edgepaths
         graph = Graph(((self.source, self.target), self.nodes, paths.data))
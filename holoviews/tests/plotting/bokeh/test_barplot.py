@@ -74,6 +74,14 @@ class TestBarPlot(TestBokehPlot):
         self.assertEqual(source.data['top'], np.array([0, 1, 2]))
         self.assertEqual(source.data['bottom'], np.array([-1, 0, 0]))
 
+    def test_bars_stacked_extents(self):
+        bars = Bars([('A', 0, 1), ('A', 1, -3), ('A', 2, 2), ('B', 0, 4), ('B', 1, np.nan)],
+                    kdims=['Index', 'Category'], vdims=['Value'])
+        plot = bokeh_renderer.get_plot(bars.opts(stacked=True, padding=0))
+        y_range = plot.handles['y_range']
+        self.assertEqual(y_range.start, -3)
+        self.assertEqual(y_range.end, 4)
+
     def test_bars_logy(self):
         bars = Bars([('A', 1), ('B', 2), ('C', 3)],
                     kdims=['Index'], vdims=['Value'])